@@ -11,24 +11,31 @@ CAMBIOS v2.0:
 from __future__ import annotations
 import argparse
 import csv
-import io
+import functools
+import hashlib
 import json
 import re
+import sqlite3
 import sys
+import threading
 import time
+import unicodedata
 import zipfile
 import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from urllib.parse import urljoin
+from typing import Iterator, Optional
+from urllib.parse import quote, urljoin, urlparse
 
 import requests
+import requests_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
 from readability import Document
-from slugify import slugify
+from readability.cleaners import html_cleaner
 import dateparser
 from jinja2 import Template
 import html2text
@@ -41,13 +48,89 @@ USER_AGENT = (
 
 MAX_FILENAME_LENGTH = 200
 MAX_TITLE_LENGTH = 100
+DEFAULT_NAME_MAX = 255
+NAME_SUFFIX_RESERVE = len("-9999.md")
+DEFAULT_WORKERS = 8
+IN_FLIGHT_PER_WORKER = 2
+POOL_MAXSIZE = 64
+CACHE_PATH = ".links_cache.sqlite"
+META_CACHE_PATH = ".links_meta.sqlite"
+CACHE_EXPIRE_S = 86400 * 7
+# Subir al cambiar lo que produce extract_meta: invalida la metadata cacheada
+META_CACHE_VERSION = 1
+CSV_SNIFF_BYTES = 64 * 1024
+WAYBACK_API_URL = "https://archive.org/wayback/available?url="
+
+_retry = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+)
 
-_session = requests.Session()
-_retry = Retry(total=3, backoff_factor=0.6, status_forcelist=[429, 500, 502, 503, 504])
-_session.mount("http://", HTTPAdapter(max_retries=_retry))
-_session.mount("https://", HTTPAdapter(max_retries=_retry))
-
-def fetch_url(url: str, timeout: int = 25) -> tuple[str, requests.Response]:
+def _build_session(cache_path: Optional[str] = None) -> requests.Session:
+    """Sesión HTTP con reintentos; con cache_path, caché en disco (respeta ETag/Last-Modified/Cache-Control)"""
+    if cache_path:
+        session = requests_cache.CachedSession(cache_path, backend="sqlite", expire_after=CACHE_EXPIRE_S, cache_control=True, wal=True)
+    else:
+        session = requests.Session()
+    session.mount("http://", HTTPAdapter(max_retries=_retry, pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE))
+    session.mount("https://", HTTPAdapter(max_retries=_retry, pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE))
+    return session
+
+# Sin caché hasta que main() llama a init_caches(): importar el módulo no crea archivos
+_session = _build_session()
+
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\w+")
+_AUTHOR_SPLIT_RE = re.compile(r"[;,]")
+_TAG_SPLIT_RE = re.compile(r"[,;|]")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+# Letras latinas que NFKD no descompone en ASCII
+_SLUG_TRANSLATE = str.maketrans({"ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ł": "l", "þ": "th", "ð": "d"})
+
+# Caché de extract_meta en su propia base SQLite (no comparte bloqueos con la caché HTTP),
+# indexada por versión + hash del HTML + URL
+_meta_db: Optional[sqlite3.Connection] = None
+_meta_db_lock = threading.Lock()
+
+# Nombres ya presentes (o reservados) por carpeta de salida; se listan una sola vez
+_existing_names: dict[Path, set[str]] = {}
+_out_path_lock = threading.Lock()
+
+# Próximo instante (time.monotonic) en que cada host puede recibir otra petición
+_next_hit: dict[str, float] = {}
+_next_hit_lock = threading.Lock()
+
+def wait_for_host(url: str, sleep_s: float) -> None:
+    """Espacia las peticiones al mismo host sleep_s segundos; hosts distintos no esperan
+
+    El hilo que espera queda bloqueado: si muchas filas seguidas del CSV son del mismo
+    host, pueden ocupar todos los workers y frenar a los demás hosts mientras tanto.
+    """
+    if sleep_s <= 0:
+        return
+    host = urlparse(url).netloc.lower()
+    with _next_hit_lock:
+        now = time.monotonic()
+        slot = max(now, _next_hit.get(host, 0.0))
+        _next_hit[host] = slot + sleep_s
+    if slot > now:
+        time.sleep(slot - now)
+
+def polite_get(url: str, sleep_s: float, **kwargs) -> requests.Response:
+    """GET que solo espera el turno del host cuando la respuesta no está ya en caché"""
+    if isinstance(_session, requests_cache.CachedSession):
+        # En un fallo de caché requests-cache devuelve un 504 "Not Cached" sintético (también from_cache)
+        resp = _session.get(url, only_if_cached=True, **kwargs)
+        if resp.status_code != 504:
+            return resp
+    wait_for_host(url, sleep_s)
+    return _session.get(url, **kwargs)
+
+def fetch_url(url: str, timeout: int = 25, sleep_s: float = 0.0) -> tuple[str, requests.Response]:
     """Obtiene contenido de una URL con headers realistas"""
     headers = {
         "User-Agent": USER_AGENT,
@@ -58,104 +141,140 @@ def fetch_url(url: str, timeout: int = 25) -> tuple[str, requests.Response]:
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
         "Referer": "https://www.google.com/",
-        "Cache-Control": "max-age=0",
     }
-    resp = _session.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    resp = polite_get(url, sleep_s, headers=headers, timeout=timeout, allow_redirects=True)
     resp.raise_for_status()
     if resp.encoding:
         resp.encoding = resp.apparent_encoding
     return resp.text, resp
 
+def _new_html2text() -> html2text.HTML2Text:
+    """Crea un conversor html2text configurado (uno por documento: acumula estado entre handle())"""
+    h = html2text.HTML2Text()
+    h.ignore_images = True
+    h.body_width = 0
+    return h
+
+def _parse_html(html: str):
+    """Parsea HTML con lxml (sin la declaración XML, que lxml rechaza en str)"""
+    html = _XML_DECL_RE.sub("", html)
+    return lxml.html.document_fromstring(html)
+
+class _TreeDocument(Document):
+    """Document de readability que parte de un árbol lxml ya parseado en lugar de re-parsear el HTML"""
+
+    def _parse(self, input):
+        # clean_html trabaja sobre una copia, así el árbol original sirve para los reintentos
+        doc = html_cleaner.clean_html(input)
+        doc.resolve_base_href(handle_failures="discard")
+        return doc
+
+def _collect_meta_tags(tree) -> dict[str, str]:
+    """Recorre los <meta> una sola vez: {property|name en minúsculas: primer content no vacío}"""
+    metas = {}
+    for m in tree.iter("meta"):
+        key = m.get("property") or m.get("name")
+        content = (m.get("content") or "").strip()
+        if key and content:
+            metas.setdefault(key.lower(), content)
+    return metas
+
+def _parse_date(value: str) -> Optional[datetime]:
+    """Parsea fechas ISO 8601 directamente; dateparser solo para otros formatos"""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return dateparser.parse(value)
+
+def _load_ld_json(text: Optional[str]):
+    """orjson para JSON-LD; json de la stdlib si hay tokens que orjson rechaza (NaN, Infinity)"""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+def _iter_ld(data) -> Iterator:
+    """Recorre los nodos de un bloque JSON-LD (lista, objeto o {"@graph": [...]})"""
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        graph = data.get("@graph")
+        if isinstance(graph, list):
+            yield from graph
+        else:
+            yield data
+
 def extract_meta(html: str, url: str) -> dict:
     """Extrae metadata de la página HTML"""
-    soup = BeautifulSoup(html, "lxml")
+    tree = _parse_html(html)
+    metas = _collect_meta_tags(tree)
     
     # URL canónica
     canonical = None
-    link_tag = soup.find("link", rel=lambda v: v and "canonical" in v.lower())
-    if link_tag and link_tag.get("href"):
-        canonical = link_tag["href"].strip()
-    og_url = soup.find("meta", property="og:url")
-    if og_url and og_url.get("content"):
-        canonical = og_url["content"].strip() or canonical
+    for link_tag in tree.xpath("//link[@rel][@href]"):
+        if "canonical" in link_tag.get("rel").lower():
+            canonical = link_tag.get("href").strip()
+            break
+    canonical = metas.get("og:url") or canonical
 
     # Título
-    title = None
-    og_title = soup.find("meta", property="og:title")
-    if og_title and og_title.get("content"):
-        title = og_title["content"].strip()
-    if not title and soup.title and soup.title.string:
-        title = soup.title.string.strip()
+    title = metas.get("og:title")
+    if not title:
+        title = (tree.findtext(".//title") or "").strip() or None
 
     # Autor y fecha (JSON-LD primero)
     author = None
     published_date = None
-    for ld in soup.find_all("script", type="application/ld+json"):
+    for ld in tree.xpath('//script[@type="application/ld+json"]'):
         try:
-            data = json.loads(ld.string)
-            candidates = data if isinstance(data, list) else [data]
-            for d in candidates:
-                if not isinstance(d, dict):
-                    continue
-                a = d.get("author")
-                if a and not author:
-                    if isinstance(a, dict) and a.get("name"):
-                        author = str(a["name"]).strip()
-                    elif isinstance(a, list) and a:
-                        if isinstance(a[0], dict) and a[0].get("name"):
-                            author = str(a[0]["name"]).strip()
-                if not published_date and d.get("datePublished"):
-                    published_date = str(d["datePublished"]).strip()
-        except:
-            pass
+            data = _load_ld_json(ld.text)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for d in _iter_ld(data):
+            if not isinstance(d, dict):
+                continue
+            a = d.get("author")
+            if a and not author:
+                if isinstance(a, dict) and a.get("name"):
+                    author = str(a["name"]).strip()
+                elif isinstance(a, list) and a:
+                    if isinstance(a[0], dict) and a[0].get("name"):
+                        author = str(a[0]["name"]).strip()
+            if not published_date and d.get("datePublished"):
+                published_date = str(d["datePublished"]).strip()
+        if author and published_date:
+            break
 
     # Fallback para autor
     if not author:
-        for key in [{"name": "author"}, {"property": "article:author"}]:
-            m = soup.find("meta", attrs=key)
-            if m and m.get("content"):
-                author = m["content"].strip()
-                break
+        author = metas.get("author") or metas.get("article:author")
 
     # Fallback para fecha
     if not published_date:
-        for key in [{"property": "article:published_time"}, {"name": "date"}]:
-            m = soup.find("meta", attrs=key)
-            if m and m.get("content"):
-                published_date = m["content"].strip()
-                break
+        published_date = metas.get("article:published_time") or metas.get("date")
 
     # Limpiar autor
     if author:
-        author = re.sub(r'\s+', ' ', author).strip()
+        author = _WS_RE.sub(' ', author).strip()
 
     # Normalizar fecha
-    published_dt = dateparser.parse(published_date) if published_date else None
+    published_dt = _parse_date(published_date) if published_date else None
     published_date_norm = published_dt.date().isoformat() if published_dt else None
 
     # Descripción
-    description = None
-    for key in [{"name": "description"}, {"property": "og:description"}]:
-        m = soup.find("meta", attrs=key)
-        if m and m.get("content"):
-            description = m["content"].strip()
-            break
+    description = metas.get("description") or metas.get("og:description")
 
     # Extraer contenido legible
-    doc = Document(html)
+    doc = _TreeDocument(tree)
     content_html = doc.summary(html_partial=True)
-    content_text = BeautifulSoup(content_html, "lxml").get_text("\n")
+    content_text = "\n".join(lxml.html.fragment_fromstring(content_html, create_parent="div").itertext())
 
     # Estadísticas
-    words = re.findall(r"\w+", content_text)
-    word_count = len(words)
+    word_count = sum(1 for _ in _WORD_RE.finditer(content_text))
     reading_time_min = max(1, round(word_count / 225))
 
     # Convertir a Markdown
-    h = html2text.HTML2Text()
-    h.ignore_images = True
-    h.body_width = 0
-    content_md = h.handle(content_html)
+    content_md = _new_html2text().handle(content_html)
 
     meta = {
         "title": title or url,
@@ -169,28 +288,76 @@ def extract_meta(html: str, url: str) -> dict:
     }
     return {"meta": meta, "content_md": content_md}
 
-def try_wayback_machine(url: str) -> Optional[tuple[str, str]]:
+def init_caches(cache_path: str = CACHE_PATH, meta_cache_path: str = META_CACHE_PATH) -> None:
+    """Activa la caché HTTP y la de metadata, descartando entradas caducadas"""
+    global _session, _meta_db
+    _session = _build_session(cache_path)
+
+    db = sqlite3.connect(meta_cache_path, timeout=30, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("CREATE TABLE IF NOT EXISTS extracted_meta (key TEXT PRIMARY KEY, created REAL NOT NULL, data BLOB NOT NULL)")
+    db.execute("DELETE FROM extracted_meta WHERE created < ?", (time.time() - CACHE_EXPIRE_S,))
+    db.commit()
+    _meta_db = db
+
+def cached_extract_meta(html: str, url: str) -> dict:
+    """extract_meta con memoización en disco: evita re-parsear HTML ya visto"""
+    if _meta_db is None:
+        return extract_meta(html, url)
+
+    # Un error de la caché cuenta como fallo de caché: nunca debe convertir la página en nota básica
+    key = hashlib.blake2b(f"{META_CACHE_VERSION}\n{url}\n{html}".encode("utf-8"), digest_size=20).hexdigest()
+    try:
+        with _meta_db_lock:
+            row = _meta_db.execute(
+                "SELECT data FROM extracted_meta WHERE key = ? AND created >= ?",
+                (key, time.time() - CACHE_EXPIRE_S),
+            ).fetchone()
+        if row:
+            return orjson.loads(row[0])
+    except (sqlite3.Error, orjson.JSONDecodeError):
+        pass
+
+    data = extract_meta(html, url)
+    try:
+        with _meta_db_lock:
+            _meta_db.execute(
+                "INSERT OR REPLACE INTO extracted_meta (key, created, data) VALUES (?, ?, ?)",
+                (key, time.time(), orjson.dumps(data)),
+            )
+            _meta_db.commit()
+    except sqlite3.Error:
+        pass
+    return data
+
+def _log(log: Optional[list[str]], msg: str) -> None:
+    """Acumula el mensaje en log (se imprime junto al resultado de la URL) o lo imprime directamente"""
+    if log is None:
+        print(msg)
+    else:
+        log.append(msg)
+
+def try_wayback_machine(url: str, sleep_s: float = 0.0, log: Optional[list[str]] = None) -> Optional[tuple[str, str]]:
     """Intenta recuperar contenido de Archive.org"""
-    print(f"  Intentando Archive.org...")
+    _log(log, "  Intentando Archive.org...")
     try:
-        api_url = f"http://archive.org/wayback/available?url={url}"
-        resp = requests.get(api_url, timeout=10)
-        data = resp.json()
+        # La URL va codificada completa: sus ?, & y # no deben mezclarse con los de la API
+        api_url = WAYBACK_API_URL + quote(url, safe="")
+        resp = polite_get(api_url, sleep_s, timeout=10, headers={"User-Agent": USER_AGENT})
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
         
-        if not data.get('archived_snapshots'):
-            return None
-            
-        closest = data['archived_snapshots'].get('closest')
-        if not closest or not closest.get('available'):
+        closest = (data.get('archived_snapshots') or {}).get('closest') or {}
+        if not closest.get('available') or not closest.get('url'):
             return None
         
         archived_url = closest['url']
-        print(f"  Snapshot encontrado")
+        _log(log, "  Snapshot encontrado")
         
-        resp = requests.get(archived_url, timeout=20)
+        resp = polite_get(archived_url, sleep_s, timeout=20, headers={"User-Agent": USER_AGENT})
         resp.raise_for_status()
         return resp.text, archived_url
-    except:
+    except (requests.RequestException, ValueError, AttributeError):
         return None
 
 def create_fallback_note(url: str, csv_metadata: dict) -> dict:
@@ -237,6 +404,8 @@ tags: {% if meta.tags %}[{% for t in meta.tags %}{{ t | tojson }}{% if not loop.
 - {{ meta.source_url }}
 """
 
+_DEFAULT_TPL = Template(DEFAULT_TEMPLATE)
+
 def normalize_tags(tags: list[str]) -> list[str]:
     """Normaliza tags: elimina duplicados y espacios (v2.0: sin agregar 'bookmark')"""
     uniq = []
@@ -250,10 +419,27 @@ def normalize_tags(tags: list[str]) -> list[str]:
             seen.add(t)
     return uniq
 
+def _fast_slug(text: str, maxlen: int) -> str:
+    """Slug ASCII en minúsculas: quita acentos (NFKD) y une palabras con guiones"""
+    text = unicodedata.normalize("NFKD", text.lower().translate(_SLUG_TRANSLATE)).encode("ascii", "ignore").decode("ascii")
+    text = _SLUG_RE.sub("-", text).strip("-")
+    return text[:maxlen].rstrip("-") or "nota"
+
+@functools.lru_cache(maxsize=None)
+def _max_base_length(folder: Path) -> int:
+    """Bytes disponibles para el slug según el límite real del sistema de archivos (eCryptfs: 143)"""
+    try:
+        name_max = os.pathconf(folder, "PC_NAME_MAX")
+    except (AttributeError, OSError, ValueError):
+        name_max = DEFAULT_NAME_MAX
+    if name_max <= 0:  # -1: sin límite definido
+        name_max = DEFAULT_NAME_MAX
+    return max(1, min(MAX_FILENAME_LENGTH, name_max - NAME_SUFFIX_RESERVE))
+
 def decide_out_path(out_dir: Path, meta: dict) -> Path:
     """Genera ruta de salida organizando por fecha"""
     ref_iso = meta.get("published_date") or datetime.utcnow().isoformat()
-    dt = dateparser.parse(ref_iso) or datetime.utcnow()
+    dt = _parse_date(ref_iso) or datetime.utcnow()
     folder = out_dir / dt.strftime("%Y") / dt.strftime("%m")
     folder.mkdir(parents=True, exist_ok=True)
 
@@ -261,23 +447,40 @@ def decide_out_path(out_dir: Path, meta: dict) -> Path:
     if len(title) > MAX_TITLE_LENGTH:
         title = title[:MAX_TITLE_LENGTH]
     
-    base = slugify(title)
-    if len(base) > MAX_FILENAME_LENGTH:
-        base = base[:MAX_FILENAME_LENGTH]
-    if not base or base == "-":
-        base = "nota"
-    
-    out = folder / f"{base}.md"
-    if not out.exists():
-        return out
+    # El slug es ASCII: longitud en caracteres == longitud en bytes
+    base = _fast_slug(title, _max_base_length(folder))
     
-    # Evitar colisiones
-    i = 2
-    while True:
-        candidate = folder / f"{base}-{i}.md"
-        if not candidate.exists():
-            return candidate
-        i += 1
+    with _out_path_lock:
+        existing = _existing_names.get(folder)
+        if existing is None:
+            existing = {entry.name for entry in os.scandir(folder)}
+            _existing_names[folder] = existing
+
+        # Evitar colisiones (el nombre queda reservado para otros hilos)
+        name = f"{base}.md"
+        i = 2
+        while name in existing:
+            name = f"{base}-{i}.md"
+            i += 1
+        existing.add(name)
+    return folder / name
+
+def write_note(path: Path, data: bytes) -> None:
+    """Escribe bytes ya codificados con una sola apertura y sin capa de texto/buffer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=8)
+def _get_template(template_path: Optional[str]) -> Template:
+    """Compila la plantilla una sola vez por ruta"""
+    if not template_path:
+        return _DEFAULT_TPL
+    return Template(Path(template_path).read_text(encoding="utf-8"))
 
 def render_markdown(meta: dict, content_md: str, template_path: Optional[str]) -> str:
     """Renderiza la nota Markdown usando la plantilla"""
@@ -285,41 +488,45 @@ def render_markdown(meta: dict, content_md: str, template_path: Optional[str]) -
     author = meta.get("author") or ""
     author_wikilinks = ""
     if author:
-        parts = re.split(r"[;,]", author)
+        parts = _AUTHOR_SPLIT_RE.split(author)
         parts = [p.strip() for p in parts if p.strip()]
         if parts:
             author_wikilinks = ", ".join(f"[[{p}]]" for p in parts)
     meta["author_wikilinks"] = author_wikilinks
     meta["created_date"] = datetime.utcnow().date().isoformat()
 
-    tpl_text = Path(template_path).read_text(encoding="utf-8") if template_path else DEFAULT_TEMPLATE
-    tpl = Template(tpl_text)
+    tpl = _get_template(template_path)
     return tpl.render(meta=meta, content_md=content_md)
 
-def process_url_with_fallbacks(url: str, tags: list[str], csv_row: dict, out_dir: Path, template_path: Optional[str], sleep_s: float) -> tuple[Optional[Path], str]:
-    """Procesa URL con estrategia de fallbacks: directo -> Archive.org -> nota básica"""
+def process_url_with_fallbacks(url: str, tags: list[str], csv_row: dict, out_dir: Path, template_path: Optional[str], sleep_s: float) -> tuple[Optional[Path], str, list[str]]:
+    """Procesa URL con estrategia de fallbacks: directo -> Archive.org -> nota básica
+
+    Devuelve también los mensajes de progreso, para que el hilo principal los imprima
+    juntos bajo la URL correspondiente.
+    """
+    log = []
     try:
-        print(f"  Intento directo...")
-        html, resp = fetch_url(url)
-        data = extract_meta(html, resp.url)
+        log.append("  Intento directo...")
+        html, resp = fetch_url(url, sleep_s=sleep_s)
+        data = cached_extract_meta(html, resp.url)
         status = "success"
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
-            print(f"  403 Forbidden")
-            wayback_result = try_wayback_machine(url)
+            log.append("  403 Forbidden")
+            wayback_result = try_wayback_machine(url, sleep_s, log)
             if wayback_result:
                 html, archived_url = wayback_result
-                data = extract_meta(html, url)
+                data = cached_extract_meta(html, url)
                 data["meta"]["source_url"] = url
                 status = "archived"
             else:
-                print(f"  Creando nota basica...")
+                log.append("  Creando nota basica...")
                 data = create_fallback_note(url, csv_row)
                 status = "fallback"
         else:
             raise
     except Exception as e:
-        print(f"  Error: {e}")
+        log.append(f"  Error: {e}")
         data = create_fallback_note(url, csv_row)
         status = "fallback"
     
@@ -331,69 +538,80 @@ def process_url_with_fallbacks(url: str, tags: list[str], csv_row: dict, out_dir
     meta["tags"] = normalize_tags(norm_tags)
     
     # Renderizar y guardar
-    md_text = render_markdown(meta, data["content_md"], template_path)
-    
-    try:
-        out_path = decide_out_path(out_dir, meta)
-        out_path.write_text(md_text, encoding="utf-8")
-    except OSError:
-        # Fallback para nombres muy largos
-        meta["title"] = meta["title"][:50]
-        out_path = decide_out_path(out_dir, meta)
-        out_path.write_text(md_text, encoding="utf-8")
+    md_bytes = render_markdown(meta, data["content_md"], template_path).encode("utf-8")
     
-    if sleep_s > 0:
-        time.sleep(sleep_s)
+    out_path = decide_out_path(out_dir, meta)
+    write_note(out_path, md_bytes)
     
-    return out_path, status
+    return out_path, status, log
 
-def read_urls_from_csv_enhanced(path: Path) -> list:
-    """Lee CSV con auto-detección de delimitador y parsing de tags"""
-    raw = path.read_text(encoding="utf-8")
-    try:
-        dialect = csv.Sniffer().sniff(raw, delimiters=",;\t|:")
-    except:
-        dialect = csv.excel
-    reader = csv.DictReader(io.StringIO(raw), dialect=dialect)
+def read_urls_from_csv_enhanced(path: Path) -> Iterator[tuple[str, list[str], dict]]:
+    """Lee CSV fila a fila con auto-detección de delimitador y parsing de tags"""
+    with path.open("r", encoding="utf-8", newline="") as f:
+        sample = f.read(CSV_SNIFF_BYTES)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|:")
+        except:
+            dialect = csv.excel
+        reader = csv.DictReader(f, dialect=dialect)
 
-    field_map = {name.lower(): name for name in (reader.fieldnames or [])}
-    if "url" not in field_map:
-        raise ValueError("El CSV debe tener una columna 'url'.")
-    
-    col_url = field_map["url"]
-    col_tags = field_map.get("tags")
-    col_title = field_map.get("title")
-    col_desc = field_map.get("description")
-
-    items = []
-    for row in reader:
-        url = (row.get(col_url) or "").strip()
-        if not url:
-            continue
-        
-        # Parsear tags (soporta JSON array o string separado)
-        tags_str = (row.get(col_tags) or "") if col_tags else ""
-        tags = []
-        rawt = tags_str.strip()
-        if rawt.startswith("[") and rawt.endswith("]"):
-            try:
-                arr = json.loads(rawt)
-                if isinstance(arr, list):
-                    tags = [str(t).strip() for t in arr if str(t).strip()]
-            except:
-                pass
-        if not tags and rawt:
-            tags = [t.strip() for t in re.split(r"[,;|]", rawt) if t.strip()]
-        
-        csv_metadata = {
-            "title": row.get(col_title, "") if col_title else "",
-            "description": row.get(col_desc, "") if col_desc else "",
-            "tags": tags,
-        }
+        field_map = {name.lower(): name for name in (reader.fieldnames or [])}
+        if "url" not in field_map:
+            raise ValueError("El CSV debe tener una columna 'url'.")
         
-        items.append((url, normalize_tags(tags), csv_metadata))
-    
-    return items
+        col_url = field_map["url"]
+        col_tags = field_map.get("tags")
+        col_title = field_map.get("title")
+        col_desc = field_map.get("description")
+
+        for row in reader:
+            url = (row.get(col_url) or "").strip()
+            if not url:
+                continue
+            
+            # Parsear tags (soporta JSON array o string separado)
+            tags_str = (row.get(col_tags) or "") if col_tags else ""
+            tags = []
+            rawt = tags_str.strip()
+            if rawt.startswith("[") and rawt.endswith("]"):
+                try:
+                    arr = orjson.loads(rawt)
+                    if isinstance(arr, list):
+                        tags = [str(t).strip() for t in arr if str(t).strip()]
+                except:
+                    pass
+            if not tags and rawt:
+                tags = [t.strip() for t in _TAG_SPLIT_RE.split(rawt) if t.strip()]
+            
+            csv_metadata = {
+                "title": row.get(col_title, "") if col_title else "",
+                "description": row.get(col_desc, "") if col_desc else "",
+                "tags": tags,
+            }
+            
+            yield url, normalize_tags(tags), csv_metadata
+
+STATUS_LABELS = {"success": "OK", "archived": "ARCHIVE", "fallback": "BASIC", "failed": "ERROR"}
+
+def _collect_result(future: Future, row_idx: int, url: str, results: dict) -> None:
+    """Imprime el progreso de una URL terminada (con los mensajes de su worker) y la anota en results"""
+    print(f"\n[{row_idx}] {url[:80]}...")
+    try:
+        out, status, log = future.result()
+        for line in log:
+            print(line)
+        results[status].append((str(out), url))
+        print(f"  {STATUS_LABELS[status]}")
+    except Exception as e:
+        print(f"  ERROR: {e}")
+        results["failed"].append(url)
+
+def _collect_finished(pending: dict, results: dict) -> None:
+    """Espera a que termine al menos una URL en curso y recoge todas las terminadas, en orden del CSV"""
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in sorted(done, key=lambda f: pending[f][0]):
+        _collect_result(future, *pending.pop(future), results)
 
 def main():
     ap = argparse.ArgumentParser(
@@ -403,6 +621,7 @@ def main():
 Ejemplos:
   python links_to_notes.py --csv bookmarks.csv --out ./notas
   python links_to_notes.py --csv bookmarks.csv --out ./notas --sleep 2
+  python links_to_notes.py --csv bookmarks.csv --out ./notas --workers 16
   
 Cambios v2.0:
   - Sin tag "bookmark" automático
@@ -411,36 +630,42 @@ Cambios v2.0:
     )
     ap.add_argument("--csv", required=True, help="Archivo CSV con URLs")
     ap.add_argument("--out", required=True, help="Carpeta de salida")
-    ap.add_argument("--sleep", type=float, default=1.0, help="Segundos entre requests (recomendado: 1-2)")
+    ap.add_argument("--sleep", type=float, default=1.0, help="Segundos entre requests al mismo host (recomendado: 1-2)")
     ap.add_argument("--template", help="Plantilla Jinja2 personalizada (opcional)")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"URLs procesadas en paralelo (por defecto: {DEFAULT_WORKERS})")
     args = ap.parse_args()
+    if args.workers < 1:
+        ap.error("--workers debe ser >= 1")
 
     out_dir = Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
-
-    items = read_urls_from_csv_enhanced(Path(args.csv))
-
-    if not items:
-        print("No hay URLs para procesar.")
-        sys.exit(1)
+    init_caches()
 
     results = {"success": [], "archived": [], "fallback": [], "failed": []}
     
     print(f"\n{'='*70}")
     print(f"Links to Notes for Obsidian v2.0")
     print(f"{'='*70}")
-    print(f"Procesando {len(items)} URLs...\n")
+    print(f"Procesando URLs de {args.csv}...\n")
     
-    for idx, (url, tags, csv_row) in enumerate(items, 1):
-        print(f"\n[{idx}/{len(items)}] {url[:80]}...")
-        try:
-            out, status = process_url_with_fallbacks(url, tags, csv_row, out_dir, args.template, args.sleep)
-            results[status].append(str(out))
-            emoji = {"success": "OK", "archived": "ARCHIVE", "fallback": "BASIC", "failed": "ERROR"}
-            print(f"  {emoji[status]}")
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            results["failed"].append(url)
+    # El CSV se lee a medida que hay hueco: como mucho IN_FLIGHT_PER_WORKER filas por worker en memoria
+    max_in_flight = IN_FLIGHT_PER_WORKER * args.workers
+    pending = {}
+    total = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for url, tags, csv_row in read_urls_from_csv_enhanced(Path(args.csv)):
+            total += 1
+            future = pool.submit(process_url_with_fallbacks, url, tags, csv_row, out_dir, args.template, args.sleep)
+            pending[future] = (total, url)
+            if len(pending) >= max_in_flight:
+                _collect_finished(pending, results)
+
+        while pending:
+            _collect_finished(pending, results)
+
+    if not total:
+        print("No hay URLs para procesar.")
+        sys.exit(1)
     
     # Generar reportes
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -451,11 +676,11 @@ Cambios v2.0:
         f.write("="*70 + "\n")
         f.write("LINKS TO NOTES FOR OBSIDIAN v2.0 - REPORTE\n")
         f.write("="*70 + "\n\n")
-        f.write(f"Total URLs: {len(items)}\n\n")
-        f.write(f"Exito directo:      {len(results['success']):4d} ({len(results['success'])/len(items)*100:5.1f}%)\n")
-        f.write(f"Desde Archive.org:  {len(results['archived']):4d} ({len(results['archived'])/len(items)*100:5.1f}%)\n")
-        f.write(f"Nota basica:        {len(results['fallback']):4d} ({len(results['fallback'])/len(items)*100:5.1f}%)\n")
-        f.write(f"Fallos:             {len(results['failed']):4d} ({len(results['failed'])/len(items)*100:5.1f}%)\n\n")
+        f.write(f"Total URLs: {total}\n\n")
+        f.write(f"Exito directo:      {len(results['success']):4d} ({len(results['success'])/total*100:5.1f}%)\n")
+        f.write(f"Desde Archive.org:  {len(results['archived']):4d} ({len(results['archived'])/total*100:5.1f}%)\n")
+        f.write(f"Nota basica:        {len(results['fallback']):4d} ({len(results['fallback'])/total*100:5.1f}%)\n")
+        f.write(f"Fallos:             {len(results['failed']):4d} ({len(results['failed'])/total*100:5.1f}%)\n\n")
         f.write(f"Notas creadas: {total_notes}\n\n")
         f.write("Cambios v2.0:\n")
         f.write("- Sin tag 'bookmark' automatico\n")
@@ -465,11 +690,8 @@ Cambios v2.0:
         fallback_file = out_dir / f"_01_manual_review_{timestamp}.txt"
         with open(fallback_file, 'w', encoding='utf-8') as f:
             f.write("URLs para revision manual:\n\n")
-            for path in results['fallback']:
-                md_content = Path(path).read_text(encoding='utf-8')
-                url_match = re.search(r'source:\s*"([^"]+)"', md_content)
-                if url_match:
-                    f.write(f"{url_match.group(1)}\n")
+            for path, url in results['fallback']:
+                f.write(f"{url}\n")
     
     if results['failed']:
         failed_file = out_dir / f"_02_failed_{timestamp}.txt"
@@ -483,7 +705,8 @@ Cambios v2.0:
     print("Creando ZIP...")
     
     zip_name = f"obsidian_notes_{timestamp}.zip"
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    # Nivel 1: las notas son texto pequeño, comprimir más apenas reduce el tamaño
+    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
         file_count = 0
         for root, dirs, files in os.walk(out_dir):
             for file in files:
@@ -509,7 +732,7 @@ Cambios v2.0:
     print("\n" + "="*70)
     print("PROCESO COMPLETADO!")
     print("="*70)
-    print(f"URLs procesadas: {len(items)}")
+    print(f"URLs procesadas: {total}")
     print(f"Notas creadas: {total_notes}")
     print(f"Archivo: {zip_name}")
     print(f"\nReportes:")